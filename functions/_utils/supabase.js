@@ -1,18 +0,0 @@
-// netlify/functions/_utils/supabase.js
-import { createClient } from '@supabase/supabase-js';
-
-export function serverClient() {
-  const url = process.env.SUPABASE_URL;
-  const key = process.env.SUPABASE_SERVICE_ROLE_KEY;
-  if (!url || !key) throw new Error('Missing SUPABASE_URL or SUPABASE_SERVICE_ROLE_KEY');
-  return createClient(url, key);
-}
-
-export async function requireUser(authHeader) {
-  if (!authHeader?.startsWith('Bearer ')) throw new Error('Unauthorized');
-  const token = authHeader.replace('Bearer ', '');
-  const supabase = serverClient();
-  const { data, error } = await supabase.auth.getUser(token);
-  if (error || !data?.user) throw new Error('Unauthorized');
-  return data.user;
-}
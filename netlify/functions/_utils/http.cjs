@@ -0,0 +1,40 @@
+// netlify/functions/_utils/http.cjs
+const { Agent, setGlobalDispatcher } = require('undici');
+
+// Outbound connection pool settings, shared by every function
+const KEEP_ALIVE_OPTIONS = {
+  keepAliveTimeout: 60000,
+  keepAliveMaxTimeout: 300000,
+  connections: 8
+};
+
+// Keep upstream connections alive between invocations on a warm instance.
+// Node's fetch closes idle sockets after 4s, shorter than the pause between
+// chat turns, so each turn would otherwise pay for a new TLS handshake.
+function enableKeepAlive() {
+  setGlobalDispatcher(new Agent(KEEP_ALIVE_OPTIONS));
+}
+
+// A frozen instance can thaw holding pooled sockets the upstream has already
+// closed; the first request on one fails with these codes
+const STALE_SOCKET_CODES = new Set(['UND_ERR_SOCKET', 'ECONNRESET']);
+
+function isStaleSocketError(error) {
+  return STALE_SOCKET_CODES.has(error?.cause?.code ?? error?.code);
+}
+
+// fetch() that retries once on a stale pooled socket. undici never retries
+// POSTs itself, so without this the turn fails. Only use it for requests that
+// are safe to send twice, and pass a string body so it can be resent.
+async function fetchWithReconnect(url, options) {
+  try {
+    return await fetch(url, options);
+  } catch (error) {
+    if (!isStaleSocketError(error) || options?.signal?.aborted) throw error;
+
+    console.warn(`⚠️ Stale connection to ${new URL(url).host}, retrying once`);
+    return fetch(url, options);
+  }
+}
+
+module.exports = { enableKeepAlive, fetchWithReconnect };
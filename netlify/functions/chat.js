@@ -1,4 +1,17 @@
 // netlify/functions/chat.js
+const { enableKeepAlive, fetchWithReconnect } = require('./_utils/http.cjs');
+
+enableKeepAlive();
+
+// Upstream request headers, built once per instance
+const OPENROUTER_HEADERS = {
+  'Authorization': `Bearer ${process.env.OPENROUTER_API_KEY}`,
+  'Content-Type': 'application/json',
+  // HTTP-Referer and X-Title only identify the app for OpenRouter attribution
+  'HTTP-Referer': 'https://group61project.netlify.app/',
+  'X-Title': 'Mind-Mapper AI',
+};
+
 exports.handler = async (event, context) => {
   const ORIGIN = event.headers.origin || event.headers.Origin || '';
   
@@ -27,8 +40,7 @@ exports.handler = async (event, context) => {
     };
   }
 
-  const key = process.env.OPENROUTER_API_KEY;
-  if (!key) {
+  if (!process.env.OPENROUTER_API_KEY) {
     return { 
       statusCode: 500, 
       headers: {
@@ -44,14 +56,9 @@ exports.handler = async (event, context) => {
     
     console.log('Forwarding request to OpenRouter...');
 
-    const resp = await fetch('https://openrouter.ai/api/v1/chat/completions', {
+    const resp = await fetchWithReconnect('https://openrouter.ai/api/v1/chat/completions', {
       method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${key}`,
-        'Content-Type': 'application/json',
-        'HTTP-Referer': event.headers.referer || 'https://your-site.netlify.app',
-        'X-Title': 'Mind-Mapper AI',
-      },
+      headers: OPENROUTER_HEADERS,
       body,
     });
 
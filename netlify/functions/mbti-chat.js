@@ -1,5 +1,43 @@
 // netlify/functions/mbti-chat.js - ChatGLM-4.5 Free MBTI Chatbot
 
+const { enableKeepAlive, fetchWithReconnect } = require('./_utils/http.cjs');
+
+enableKeepAlive();
+
+// Upstream request headers, built once per instance
+const OPENROUTER_HEADERS = {
+  'Authorization': `Bearer ${process.env.OPENROUTER_API_KEY}`,
+  'Content-Type': 'application/json',
+  'HTTP-Referer': 'https://group61project.netlify.app/',
+  'X-Title': 'Mind-Mapper AI'
+};
+
+// Optimized system prompt for ChatGLM-4.5, built once per instance
+const MBTI_SYSTEM_PROMPT = `You are an MBTI personality analyst. Your job is to determine someone's Myers-Briggs personality type through conversation.
+
+CONVERSATION RULES:
+1. Ask 5-7 questions total about: energy source (E/I), information processing (S/N), decision-making (T/F), and planning style (J/P)
+2. ALWAYS respond with ONLY valid JSON in this exact format:
+{
+  "message": "your conversational question or analysis here",
+  "type": "ENFP",
+  "confidence": 0.8,
+  "ready": false,
+  "progress": 3
+}
+3. Set "ready": true and provide "type" when you have enough information (after 5-7 exchanges)
+4. Be friendly and natural in your questions
+5. NO markdown formatting in JSON - just plain text
+6. Progress should be 1-5 (1=start, 5=complete)
+
+MBTI TYPES TO CHOOSE FROM:
+INTJ, INTP, ENTJ, ENTP, INFJ, INFP, ENFJ, ENFP, ISTJ, ISFJ, ESTJ, ESFJ, ISTP, ISFP, ESTP, ESFP
+
+For first message, ask about energy/recharging. For continuing, ask follow-up questions about learning style, decision-making, or planning preferences.
+
+Return ONLY the JSON response, no other text.`;
+const SYSTEM_MESSAGE = { role: 'system', content: MBTI_SYSTEM_PROMPT };
+
 exports.handler = async (event, context) => {
   console.log('🚀 MBTI Chat function started with ChatGLM-4.5');
   
@@ -40,46 +78,16 @@ exports.handler = async (event, context) => {
     const { messages = [] } = requestData;
     console.log(`Processing ${messages.length} messages with ChatGLM-4.5`);
     
-    // Optimized system prompt for ChatGLM-4.5
-    const systemPrompt = `You are an MBTI personality analyst. Your job is to determine someone's Myers-Briggs personality type through conversation.
-
-CONVERSATION RULES:
-1. Ask 5-7 questions total about: energy source (E/I), information processing (S/N), decision-making (T/F), and planning style (J/P)
-2. ALWAYS respond with ONLY valid JSON in this exact format:
-{
-  "message": "your conversational question or analysis here",
-  "type": "ENFP",
-  "confidence": 0.8,
-  "ready": false,
-  "progress": 3
-}
-3. Set "ready": true and provide "type" when you have enough information (after 5-7 exchanges)
-4. Be friendly and natural in your questions
-5. NO markdown formatting in JSON - just plain text
-6. Progress should be 1-5 (1=start, 5=complete)
-
-MBTI TYPES TO CHOOSE FROM:
-INTJ, INTP, ENTJ, ENTP, INFJ, INFP, ENFJ, ENFP, ISTJ, ISFJ, ESTJ, ESFJ, ISTP, ISFP, ESTP, ESFP
-
-For first message, ask about energy/recharging. For continuing, ask follow-up questions about learning style, decision-making, or planning preferences.
-
-Return ONLY the JSON response, no other text.`;
-
     // Prepare messages for API
     const apiMessages = [
-      { role: 'system', content: systemPrompt },
+      SYSTEM_MESSAGE,
       ...messages
     ];
     
     // Call OpenRouter API with ChatGLM-4.5 (FREE model)
-    const response = await fetch('https://openrouter.ai/api/v1/chat/completions', {
+    const response = await fetchWithReconnect('https://openrouter.ai/api/v1/chat/completions', {
       method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${process.env.OPENROUTER_API_KEY}`,
-        'Content-Type': 'application/json',
-        'HTTP-Referer': 'https://group61project.netlify.app/',
-        'X-Title': 'Mind-Mapper AI'
-      },
+      headers: OPENROUTER_HEADERS,
       body: JSON.stringify({
         model: 'zhipuai/glm-4-9b-chat', // ChatGLM-4.5 free model
         messages: apiMessages,
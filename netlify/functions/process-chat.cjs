@@ -1,8 +1,8 @@
 // process-chat.js - Production-Ready Secure Implementation
 // Mind-Mapper AI - Enhanced Security with Full Functionality
 
-const { createClient } = require('@supabase/supabase-js');
 const crypto = require('crypto');
+const { enableKeepAlive, fetchWithReconnect } = require('./_utils/http.cjs');
 
 // --- 1. SECURITY CONFIGURATION ---
 
@@ -30,9 +30,43 @@ const CONFIG = {
   // OpenAI configuration
   openai: {
     model: 'gpt-4o', // Will use GPT-5 when available
+    // Smaller model for the opening turns; it is told not to finalize
+    lightModel: 'gpt-4o-mini',
+    minUserTurnsForAnalysis: 3,
     maxTokens: 800,
     temperature: 0.75,
-    timeout: 30000
+    timeout: 30000,
+    // Routes requests sharing the system prompt prefix to the same cache
+    promptCacheKey: 'mind-mapper-mbti-v1',
+    // Upstream 429 handling: how long a request may wait on Retry-After
+    rateLimit: {
+      maxWaitMs: 5000,
+      defaultRetryAfterMs: 2000
+    }
+  },
+  
+  // Conversation context sent to the model
+  context: {
+    maxRecentMessages: 10, // Older messages are folded into a summary
+    summaryModel: 'gpt-4o-mini',
+    summaryMaxTokens: 200,
+    summaryTimeout: 8000
+  },
+  
+  // Response cache settings (per warm function instance)
+  cache: {
+    maxEntries: 512,
+    ttlMs: 60 * 60 * 1000 // 1 hour
+  },
+  
+  // Semantic cache settings (paraphrased opening turns, opt-in)
+  semanticCache: {
+    enabled: process.env.SEMANTIC_CACHE_ENABLED === 'true',
+    embeddingModel: 'text-embedding-3-small',
+    similarityThreshold: 0.97,
+    maxQueryLength: 40, // only short, generic openers are shared across users
+    maxEntries: 256,
+    timeout: 5000
   },
   
   // Security settings
@@ -44,13 +78,23 @@ const CONFIG = {
   }
 };
 
+// Reuse OpenAI and Supabase connections across invocations
+enableKeepAlive();
+
 // --- 2. INITIALIZE SUPABASE CLIENT ---
 
 let supabaseClient = null;
+let supabaseInitAttempted = false;
+
+// The Supabase SDK is loaded on first use rather than at startup, so cold
+// starts that only serve preflights or rejected requests skip its import cost
+function getSupabaseClient() {
+  if (supabaseInitAttempted) return supabaseClient;
+  supabaseInitAttempted = true;
 
-function initializeSupabase() {
   if (process.env.SUPABASE_URL && process.env.SUPABASE_SERVICE_KEY) {
     try {
+      const { createClient } = require('@supabase/supabase-js');
       supabaseClient = createClient(
         process.env.SUPABASE_URL, 
         process.env.SUPABASE_SERVICE_KEY,
@@ -60,19 +104,15 @@ function initializeSupabase() {
         }
       );
       console.log('✅ Supabase client initialized successfully');
-      return true;
     } catch (error) {
       console.error('❌ Failed to initialize Supabase client:', error.message);
-      return false;
     }
   } else {
     console.error('❌ Missing Supabase environment variables');
-    return false;
   }
-}
 
-// Initialize on startup
-const supabaseInitialized = initializeSupabase();
+  return supabaseClient;
+}
 
 // --- 3. ENHANCED MBTI SYSTEM PROMPT ---
 
@@ -137,12 +177,23 @@ Analyze the provided message history.
 - If the conversation is still developing, update the progress, ask a relevant and insightful follow-up question, and set "ready_for_analysis" to false.
 - If the conversation has sufficient depth across all dimensions OR the user explicitly asks for their result with enough context, provide the complete, final analysis and set "ready_for_analysis" to true.`;
 
+// The system message never changes, so build it once and share it
+const MBTI_SYSTEM_MESSAGE = Object.freeze({ role: 'system', content: MBTI_SYSTEM_PROMPT });
+
+// Sent after the system prompt on light-model turns, so the final analysis is
+// left to the main model on a later turn
+const LIGHT_MODEL_MESSAGE = Object.freeze({
+  role: 'system',
+  content: 'Do not provide the final analysis on this turn: set "ready_for_analysis" to false and ask the next follow-up question. If the user asks for their result, briefly explain that a couple more answers are needed first.'
+});
+
 // --- 4. SECURITY MANAGEMENT CLASS ---
 
 class SecurityManager {
   constructor() {
     this.rateLimit = new Map();
     this.suspiciousActivity = new Map();
+    this.pendingWrites = new Set();
     this.startCleanupInterval();
   }
 
@@ -230,23 +281,34 @@ class SecurityManager {
     validTimestamps.push(now);
     this.rateLimit.set(key, validTimestamps);
     
-    // Also update database rate limit if available
-    if (supabaseClient) {
-      try {
-        await this.updateDatabaseRateLimit(hashedIP, endpoint, validTimestamps.length);
-      } catch (error) {
-        console.error('Database rate limit update failed:', error.message);
-      }
+    // Also update database rate limit if available. The in-memory check above
+    // already decided this request, so the write runs alongside the rest of
+    // the request instead of delaying it; the handler flushes it before returning.
+    if (getSupabaseClient()) {
+      this.trackWrite(this.updateDatabaseRateLimit(hashedIP, endpoint, validTimestamps.length));
     }
     
     return true;
   }
 
+  // Track a background database write so it can be awaited later
+  trackWrite(promise) {
+    const tracked = promise
+      .catch(error => console.error('Database rate limit update failed:', error.message))
+      .finally(() => this.pendingWrites.delete(tracked));
+    this.pendingWrites.add(tracked);
+  }
+
+  // Wait for all background writes (never rejects)
+  async flushPendingWrites() {
+    await Promise.all(this.pendingWrites);
+  }
+
   // Update database rate limit record
   async updateDatabaseRateLimit(hashedIP, endpoint, count) {
     const windowStart = new Date(Date.now() - CONFIG.rateLimits[endpoint].windowMs);
     
-    await supabaseClient
+    await getSupabaseClient()
       .from('rate_limits')
       .upsert({
         ip_address: hashedIP,
@@ -458,42 +520,411 @@ class SecurityManager {
   }
 }
 
-// --- 5. OPENAI INTEGRATION ---
+// --- 5. RESPONSE CACHE ---
+
+// OpenAI endpoints and request headers, built once per instance
+const OPENAI_API_BASE = 'https://api.openai.com/v1';
+const OPENAI_HEADERS = {
+  'Authorization': `Bearer ${process.env.OPENAI_API_KEY}`,
+  'Content-Type': 'application/json',
+  'User-Agent': 'MindMapperAI/1.0'
+};
+
+// Exact-match cache of AI replies keyed by SHA256(model + messages).
+// Lives in module scope so it survives across invocations on a warm instance;
+// a Map keeps insertion order, which gives us cheap LRU eviction.
+class ResponseCache {
+  constructor({ maxEntries, ttlMs }) {
+    this.maxEntries = maxEntries;
+    this.ttlMs = ttlMs;
+    this.entries = new Map();
+  }
+
+  // Build a stable cache key for a model + message list
+  static key(model, messages) {
+    return crypto
+      .createHash('sha256')
+      .update(JSON.stringify({ m: model, msgs: messages }))
+      .digest('hex');
+  }
+
+  get(key) {
+    const entry = this.entries.get(key);
+    if (!entry) return null;
+
+    if (Date.now() - entry.storedAt > this.ttlMs) {
+      this.entries.delete(key);
+      return null;
+    }
+
+    // Refresh recency
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  set(key, value) {
+    this.entries.delete(key);
+    this.entries.set(key, { value, storedAt: Date.now() });
+
+    // Evict least recently used entries
+    while (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value);
+    }
+  }
+}
+
+// Semantic cache: reuses a reply when the latest user turn is a paraphrase of
+// one already answered after the exact same conversation prefix. Entries are
+// scoped by the prefix hash so a reply is never reused in a different context.
+class SemanticCache {
+  constructor({ maxEntries, similarityThreshold }) {
+    this.maxEntries = maxEntries;
+    this.similarityThreshold = similarityThreshold;
+    this.entries = [];
+  }
+
+  // Normalize to unit length so cosine similarity becomes a dot product
+  static normalize(vector) {
+    const result = Float32Array.from(vector);
+    let norm = 0;
+    for (let i = 0; i < result.length; i++) norm += result[i] * result[i];
+    norm = Math.sqrt(norm) || 1;
+    for (let i = 0; i < result.length; i++) result[i] /= norm;
+    return result;
+  }
+
+  search(scope, embedding) {
+    let best = null;
+    let bestScore = -1;
+
+    for (const entry of this.entries) {
+      if (entry.scope !== scope || entry.embedding.length !== embedding.length) continue;
+
+      let score = 0;
+      for (let i = 0; i < embedding.length; i++) score += entry.embedding[i] * embedding[i];
+
+      if (score > bestScore) {
+        bestScore = score;
+        best = entry;
+      }
+    }
+
+    return best && bestScore >= this.similarityThreshold
+      ? { value: best.value, score: bestScore }
+      : null;
+  }
+
+  add(scope, embedding, value) {
+    this.entries.push({ scope, embedding, value });
+
+    // Drop the oldest entries once full
+    if (this.entries.length > this.maxEntries) {
+      this.entries.splice(0, this.entries.length - this.maxEntries);
+    }
+  }
+}
+
+const responseCache = new ResponseCache(CONFIG.cache);
+const semanticCache = new SemanticCache(CONFIG.semanticCache);
+
+// Embed a single text with OpenAI; returns null on any failure so callers
+// can simply fall through to a normal completion request
+async function getEmbedding(text) {
+  const controller = new AbortController();
+  const timeoutId = setTimeout(() => controller.abort(), CONFIG.semanticCache.timeout);
+
+  try {
+    await openAIRetryGate.wait();
+
+    const response = await fetchWithReconnect(`${OPENAI_API_BASE}/embeddings`, {
+      method: 'POST',
+      headers: OPENAI_HEADERS,
+      body: JSON.stringify({
+        model: CONFIG.semanticCache.embeddingModel,
+        input: text
+      }),
+      signal: controller.signal
+    });
+
+    if (!response.ok) {
+      console.warn('⚠️ Embedding request failed:', response.status);
+      if (response.status === 429) {
+        openAIRetryGate.pause(parseRetryAfter(response.headers.get('retry-after')));
+      }
+      await response.body?.cancel();
+      return null;
+    }
+
+    const jsonResponse = await response.json();
+    const embedding = jsonResponse.data?.[0]?.embedding;
+    return Array.isArray(embedding) ? SemanticCache.normalize(embedding) : null;
+
+  } catch (error) {
+    console.warn('⚠️ Embedding request error:', error.message);
+    return null;
+  } finally {
+    clearTimeout(timeoutId);
+  }
+}
+
+// --- 6. OPENAI INTEGRATION ---
+
+// Shared Retry-After window for every outbound OpenAI call. Each instance
+// handles one event at a time, so a local request budget would never fill;
+// what does carry over between requests is OpenAI telling us to back off.
+class RetryAfterGate {
+  constructor({ maxWaitMs }) {
+    this.maxWaitMs = maxWaitMs;
+    this.blockedUntil = 0;
+  }
+
+  // Wait out an active Retry-After window, or fail fast if it is too long
+  async wait() {
+    const waitMs = this.blockedUntil - Date.now();
+    if (waitMs <= 0) return;
+
+    if (waitMs > this.maxWaitMs) {
+      throw new Error('OpenAI rate limit exceeded. Please try again later.');
+    }
+    await new Promise(resolve => setTimeout(resolve, waitMs));
+  }
+
+  // Stop sending until the upstream Retry-After window has passed
+  pause(ms) {
+    this.blockedUntil = Math.max(this.blockedUntil, Date.now() + ms);
+  }
+}
+
+const openAIRetryGate = new RetryAfterGate(CONFIG.openai.rateLimit);
+
+// Parse a Retry-After header (seconds or HTTP date) into milliseconds
+function parseRetryAfter(value) {
+  if (!value) return CONFIG.openai.rateLimit.defaultRetryAfterMs;
+
+  const seconds = Number(value);
+  if (!Number.isNaN(seconds)) return Math.max(0, seconds * 1000);
+
+  const date = Date.parse(value);
+  return Number.isNaN(date)
+    ? CONFIG.openai.rateLimit.defaultRetryAfterMs
+    : Math.max(0, date - Date.now());
+}
+
+const SUMMARY_SYSTEM_MESSAGE = Object.freeze({
+  role: 'system',
+  content: `Summarize the following part of an MBTI assessment conversation in under 100 words. Keep every concrete detail the user shared about how they gain energy, process information, make decisions, and organize their life. Assistant turns may be JSON; only keep what they asked. Output plain text only.`
+});
+
+const summaryCache = new ResponseCache(CONFIG.cache);
+
+// Compress older turns into a short summary with a small model. Summaries are
+// cached by content, so each block of history is summarized at most once.
+async function summarizeMessages(messages) {
+  const cacheKey = ResponseCache.key(CONFIG.context.summaryModel, messages);
+  const cachedSummary = summaryCache.get(cacheKey);
+  if (cachedSummary) return cachedSummary;
+
+  const transcript = messages
+    .map(msg => `${msg.role === 'user' ? 'User' : 'Assistant'}: ${msg.content}`)
+    .join('\n');
+
+  const requestPayload = JSON.stringify({
+    model: CONFIG.context.summaryModel,
+    messages: [
+      SUMMARY_SYSTEM_MESSAGE,
+      { role: 'user', content: transcript }
+    ],
+    temperature: 0,
+    max_tokens: CONFIG.context.summaryMaxTokens
+  });
+
+  const controller = new AbortController();
+  const timeoutId = setTimeout(() => controller.abort(), CONFIG.context.summaryTimeout);
+
+  try {
+    await openAIRetryGate.wait();
+
+    const response = await fetchWithReconnect(`${OPENAI_API_BASE}/chat/completions`, {
+      method: 'POST',
+      headers: OPENAI_HEADERS,
+      body: requestPayload,
+      signal: controller.signal
+    });
+
+    if (!response.ok) {
+      console.warn('⚠️ Summary request failed:', response.status);
+      if (response.status === 429) {
+        openAIRetryGate.pause(parseRetryAfter(response.headers.get('retry-after')));
+      }
+      await response.body?.cancel();
+      return null;
+    }
+
+    const jsonResponse = await response.json();
+    const summary = jsonResponse.choices?.[0]?.message?.content?.trim();
+    if (!summary) return null;
+
+    summaryCache.set(cacheKey, summary);
+    return summary;
+
+  } catch (error) {
+    console.warn('⚠️ Summary request error:', error.message);
+    return null;
+  } finally {
+    clearTimeout(timeoutId);
+  }
+}
+
+// Keep the most recent messages verbatim and replace older ones with a
+// summary. Older messages are summarized in fixed blocks of maxRecentMessages,
+// each cached by content, so a block is summarized once however far the chat
+// grows. Blocks are counted from the first message sent, so once a chat passes
+// the message cap the client also drops its history in whole blocks (see
+// index.html). Falls back to the full history if summarization fails.
+async function trimContext(messages) {
+  const { maxRecentMessages } = CONFIG.context;
+  const olderCount = Math.floor((messages.length - maxRecentMessages) / maxRecentMessages) * maxRecentMessages;
+  if (olderCount <= 0) return messages;
+
+  const blocks = [];
+  for (let start = 0; start < olderCount; start += maxRecentMessages) {
+    blocks.push(messages.slice(start, start + maxRecentMessages));
+  }
+
+  const summaries = await Promise.all(blocks.map(summarizeMessages));
+  if (summaries.some(summary => !summary)) return messages;
+
+  console.log(`✂️ Summarized ${olderCount} older messages`);
+  return [
+    { role: 'system', content: `Summary of the earlier conversation:\n${summaries.join('\n\n')}` },
+    ...messages.slice(olderCount)
+  ];
+}
+
+// The opening turns go to the smaller, faster model. It is told not to
+// finalize (LIGHT_MODEL_MESSAGE), so final analyses come from the main model.
+function selectModel(userTurnCount) {
+  return userTurnCount < CONFIG.openai.minUserTurnsForAnalysis
+    ? CONFIG.openai.lightModel
+    : CONFIG.openai.model;
+}
 
+// Graceful fallback reply in the required JSON format, serialized once
+const FALLBACK_AI_RESPONSE = {
+  content: JSON.stringify({
+    ready_for_analysis: false,
+    one_liner: "I'm experiencing a temporary connection issue. Could you please try asking that again in a moment?",
+    progress: {
+      current_step: 1,
+      total_steps: 5,
+      step_description: "System error - please retry",
+      dimensions_explored: {
+        energy_source: false,
+        information_processing: false,
+        decision_making: false,
+        lifestyle_preferences: false
+      }
+    }
+  }),
+  isFinalAnalysis: false
+};
+
+// Returns { content, isFinalAnalysis }: the raw JSON reply plus the one field
+// the handler needs from it, so the reply is only parsed once. Cache entries
+// store the same object.
 async function getAIResponseFromOpenAI(messages) {
-  const OPENAI_API_URL = 'https://api.openai.com/v1/chat/completions';
-  
   if (!process.env.OPENAI_API_KEY) {
     throw new Error('OpenAI API key is not configured');
   }
 
+  const userTurns = messages.filter(msg => msg.role === 'user').map(msg => msg.content);
+  const model = selectModel(userTurns.length);
+
+  const cacheKey = ResponseCache.key(model, messages);
+  const cachedResponse = responseCache.get(cacheKey);
+  if (cachedResponse) {
+    console.log('⚡ Serving AI response from cache');
+    return cachedResponse;
+  }
+
+  // Look for a paraphrase of the latest user turn after the same prefix
+  const lastMessage = messages[messages.length - 1];
+  const semanticScope = ResponseCache.key(model, messages.slice(0, -1));
+  // Only the opening turn shares its prefix (the welcome message) with other
+  // conversations, and a hit there is served to a different visitor. Longer
+  // openers usually carry personal details, and small edits or negations
+  // still embed close together, so only short, generic ones are eligible.
+  const useSemanticCache = CONFIG.semanticCache.enabled &&
+    lastMessage?.role === 'user' &&
+    userTurns.length === 1 &&
+    lastMessage.content.length <= CONFIG.semanticCache.maxQueryLength;
+
+  // The embedding lookup and the context summary are independent, so run
+  // them concurrently. A summary computed ahead of a semantic hit is not
+  // wasted: it is cached for the following turns. Neither call rejects.
+  const [queryEmbedding, contextMessages] = await Promise.all([
+    useSemanticCache ? getEmbedding(lastMessage.content) : null,
+    trimContext(messages)
+  ]);
+
+  const match = queryEmbedding && semanticCache.search(semanticScope, queryEmbedding);
+  if (match) {
+    console.log(`⚡ Serving AI response from semantic cache (similarity ${match.score.toFixed(3)})`);
+    responseCache.set(cacheKey, match.value);
+    return match.value;
+  }
+
   const requestBody = {
-    model: CONFIG.openai.model,
+    model,
     messages: [
-      { role: 'system', content: MBTI_SYSTEM_PROMPT },
-      ...messages
+      MBTI_SYSTEM_MESSAGE,
+      ...(model === CONFIG.openai.lightModel ? [LIGHT_MODEL_MESSAGE] : []),
+      ...contextMessages
     ],
     response_format: { type: "json_object" },
     temperature: CONFIG.openai.temperature,
     max_tokens: CONFIG.openai.maxTokens,
+    prompt_cache_key: CONFIG.openai.promptCacheKey
   };
 
+  const requestPayload = JSON.stringify(requestBody);
+
   const controller = new AbortController();
   const timeoutId = setTimeout(() => controller.abort(), CONFIG.openai.timeout);
 
-  try {
-    console.log(`🚀 Sending request to OpenAI with model: ${CONFIG.openai.model}...`);
-    
-    const response = await fetch(OPENAI_API_URL, {
+  const sendRequest = async () => {
+    await openAIRetryGate.wait();
+    return fetchWithReconnect(`${OPENAI_API_BASE}/chat/completions`, {
       method: 'POST',
-      headers: {
-        'Authorization': `Bearer ${process.env.OPENAI_API_KEY}`,
-        'Content-Type': 'application/json',
-        'User-Agent': 'MindMapperAI/1.0'
-      },
-      body: JSON.stringify(requestBody),
+      headers: OPENAI_HEADERS,
+      body: requestPayload,
       signal: controller.signal
     });
+  };
+
+  try {
+    console.log(`🚀 Sending request to OpenAI with model: ${model}...`);
+    
+    let response = await sendRequest();
+
+    // Honour upstream throttling: pause all outbound calls and retry once if
+    // the requested wait is short enough to fit in this invocation
+    if (response.status === 429) {
+      const retryAfterMs = parseRetryAfter(response.headers.get('retry-after'));
+      openAIRetryGate.pause(retryAfterMs);
+
+      if (retryAfterMs <= CONFIG.openai.rateLimit.maxWaitMs) {
+        console.warn(`⏳ OpenAI rate limited, retrying in ${retryAfterMs}ms`);
+        // Release the pooled socket before reusing the connection
+        await response.body?.cancel();
+        response = await sendRequest();
+
+        if (response.status === 429) {
+          openAIRetryGate.pause(parseRetryAfter(response.headers.get('retry-after')));
+        }
+      }
+    }
 
     clearTimeout(timeoutId);
 
@@ -522,15 +953,25 @@ async function getAIResponseFromOpenAI(messages) {
     const aiContent = jsonResponse.choices[0].message.content;
     
     // Validate that the response is valid JSON
+    let aiData;
     try {
-      JSON.parse(aiContent);
+      aiData = JSON.parse(aiContent);
     } catch (parseError) {
       console.error('❌ OpenAI returned invalid JSON:', aiContent);
       throw new Error('AI response format error');
     }
 
+    const aiResponse = {
+      content: aiContent,
+      isFinalAnalysis: aiData?.ready_for_analysis === true
+    };
+
     console.log('✅ Successfully received and validated AI response');
-    return aiContent;
+    responseCache.set(cacheKey, aiResponse);
+    if (queryEmbedding) {
+      semanticCache.add(semanticScope, queryEmbedding, aiResponse);
+    }
+    return aiResponse;
 
   } catch (error) {
     clearTimeout(timeoutId);
@@ -542,28 +983,15 @@ async function getAIResponseFromOpenAI(messages) {
     console.error('💥 OpenAI request error:', error.message);
     
     // Return a graceful fallback error message in the required JSON format
-    return JSON.stringify({
-      ready_for_analysis: false,
-      one_liner: "I'm experiencing a temporary connection issue. Could you please try asking that again in a moment?",
-      progress: {
-        current_step: 1,
-        total_steps: 5,
-        step_description: "System error - please retry",
-        dimensions_explored: {
-          energy_source: false,
-          information_processing: false,
-          decision_making: false,
-          lifestyle_preferences: false
-        }
-      }
-    });
+    return FALLBACK_AI_RESPONSE;
   }
 }
 
-// --- 6. DATABASE OPERATIONS ---
+// --- 7. DATABASE OPERATIONS ---
 
 async function saveConversationToDatabase(messages, aiResponse, securityContext) {
-  if (!supabaseClient) {
+  const supabase = getSupabaseClient();
+  if (!supabase) {
     console.warn('⚠️ Supabase not initialized, skipping database save');
     return Date.now(); // Return fallback ID
   }
@@ -584,7 +1012,7 @@ async function saveConversationToDatabase(messages, aiResponse, securityContext)
       language: securityContext.language || 'en'
     };
 
-    const { data, error } = await supabaseClient
+    const { data, error } = await supabase
       .from('conversations')
       .insert(conversationData)
       .select('id')
@@ -610,11 +1038,21 @@ async function saveConversationToDatabase(messages, aiResponse, securityContext)
   }
 }
 
-// --- 7. MAIN HANDLER FUNCTION ---
+// --- 8. MAIN HANDLER FUNCTION ---
 
 const securityManager = new SecurityManager();
 
+// Background database writes are flushed before every response, since the
+// instance may be frozen as soon as the handler returns
 exports.handler = async (event) => {
+  try {
+    return await processRequest(event);
+  } finally {
+    await securityManager.flushPendingWrites();
+  }
+};
+
+async function processRequest(event) {
   const startTime = Date.now();
   const origin = event.headers?.origin || '';
   const ip = securityManager.getClientIP(event);
@@ -652,6 +1090,19 @@ exports.handler = async (event) => {
     };
   }
 
+  // Check request size (before rate limiting, which loads the Supabase client)
+  const requestSize = Buffer.byteLength(event.body || '{}');
+  if (requestSize > CONFIG.security.maxRequestSize) {
+    await securityManager.logSecurityEvent('REQUEST_TOO_LARGE', ip, {
+      size: requestSize
+    });
+    return {
+      statusCode: 413,
+      headers: secureHeaders,
+      body: JSON.stringify({ error: 'Request too large' })
+    };
+  }
+
   // Check rate limiting
   const rateLimitPassed = await securityManager.checkRateLimit(ip, 'chat');
   if (!rateLimitPassed) {
@@ -680,19 +1131,6 @@ exports.handler = async (event) => {
     };
   }
 
-  // Check request size
-  const requestSize = Buffer.byteLength(event.body || '{}');
-  if (requestSize > CONFIG.security.maxRequestSize) {
-    await securityManager.logSecurityEvent('REQUEST_TOO_LARGE', ip, {
-      size: requestSize
-    });
-    return {
-      statusCode: 413,
-      headers: secureHeaders,
-      body: JSON.stringify({ error: 'Request too large' })
-    };
-  }
-
   try {
     // Parse and validate request body
     let body;
@@ -732,16 +1170,7 @@ exports.handler = async (event) => {
     console.log(`📥 Processing ${sanitizedMessages.length} messages from ${securityManager.hashIP(ip)}`);
 
     // Get AI response
-    const aiResponse = await getAIResponseFromOpenAI(sanitizedMessages);
-
-    // Determine if this is a final analysis
-    let isFinalAnalysis = false;
-    try {
-      const aiData = JSON.parse(aiResponse);
-      isFinalAnalysis = aiData.ready_for_analysis === true;
-    } catch (e) {
-      // If parsing fails, it's not a final analysis
-    }
+    const { content: aiResponse, isFinalAnalysis } = await getAIResponseFromOpenAI(sanitizedMessages);
 
     // Prepare security context for database save
     const securityContext = {
@@ -800,4 +1229,4 @@ exports.handler = async (event) => {
       })
     };
   }
-};
\ No newline at end of file
+}
\ No newline at end of file
@@ -1,5 +1,9 @@
 // Simple, reliable ChatGPT-4 MBTI chatbot via OpenRouter
 
+const { enableKeepAlive, fetchWithReconnect } = require('./_utils/http.cjs');
+
+enableKeepAlive();
+
 const OPENROUTER_API_BASE = 'https://openrouter.ai/api/v1';
 const OPENROUTER_HEADERS = {
   Authorization: `Bearer ${process.env.OPENROUTER_API_KEY}`,
@@ -71,6 +75,24 @@ Final analysis:
 
 Remember: Always return valid JSON only. Be natural and conversational while gathering the information needed for accurate MBTI assessment.`;
 
+// Mark the stable part of the prompt (system prompt + prior history) with
+// cache breakpoints so Anthropic models reuse the prefilled prefix instead of
+// reprocessing the whole conversation every turn. Other providers cache
+// prefixes automatically, so their messages are sent unchanged.
+function withPromptCache(model, messages) {
+  if (!model.startsWith('anthropic/')) return messages;
+
+  const cacheable = (message) => ({
+    role: message.role,
+    content: [{ type: 'text', text: message.content, cache_control: { type: 'ephemeral' } }]
+  });
+
+  const lastStableIndex = messages.length - 2;
+  return messages.map((message, index) =>
+    index === 0 || (index === lastStableIndex && index > 0) ? cacheable(message) : message
+  );
+}
+
 async function callChatGPT(messages) {
   let lastError = null;
   
@@ -81,15 +103,15 @@ async function callChatGPT(messages) {
       
       const requestBody = {
         model,
-        messages: [
+        messages: withPromptCache(model, [
           { role: 'system', content: MBTI_SYSTEM_PROMPT },
           ...messages
-        ],
+        ]),
         max_tokens: 300,
         temperature: 0.7
       };
       
-      const response = await fetch(`${OPENROUTER_API_BASE}/chat/completions`, {
+      const response = await fetchWithReconnect(`${OPENROUTER_API_BASE}/chat/completions`, {
         method: 'POST',
         headers: OPENROUTER_HEADERS,
         body: JSON.stringify(requestBody)